@@ -0,0 +1,6 @@
+"""Wind swaths of tropical cyclones from ATCF best track data."""
+
+from .data import Dataset, read_b_deck
+from .path import calculate_wind_at_given_distance, haversine_distance
+
+__all__ = ["Dataset", "read_b_deck", "calculate_wind_at_given_distance", "haversine_distance"]
@@ -0,0 +1,73 @@
+"""Command line interface."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+import numpy as np
+
+from .data import Dataset, read_b_deck
+
+
+@click.command()
+@click.argument("b_deck", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("out_file", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--roi",
+    nargs=4,
+    type=float,
+    default=(17.5, 18.5, -67.5, -65.5),
+    show_default=True,
+    help="Region of interest: min_latitude max_latitude min_longitude max_longitude.",
+)
+@click.option(
+    "--resolution",
+    nargs=2,
+    type=float,
+    default=(0.1, 0.1),
+    show_default=True,
+    help="Latitudinal and longitudinal grid spacing in degrees.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["netcdf4", "h5netcdf"]),
+    default="netcdf4",
+    show_default=True,
+    help="Library used to write the netCDF file, h5netcdf requires the h5netcdf extra.",
+)
+def main(
+    b_deck: Path,
+    out_file: Path,
+    roi: tuple[float, float, float, float],
+    resolution: tuple[float, float],
+    engine: str,
+) -> None:
+    """Calculate the wind field along a storm track.
+
+    B_DECK is an ATCF best track file, optionally gzip compressed, the wind
+    speed on the grid is written to the netCDF file OUT_FILE.
+    """
+    nc_dataset = Dataset.from_roi(roi, resolution).calculate_wind_profile(read_b_deck(b_deck))
+    out_file.parent.mkdir(exist_ok=True, parents=True)
+    # One chunk per time step, matching the way the field is computed and read.
+    chunksizes = (1, nc_dataset.sizes["lat"], nc_dataset.sizes["lon"])
+    nc_dataset.to_netcdf(
+        out_file,
+        mode="w",
+        engine=engine,
+        encoding={
+            "wsp": {
+                "dtype": "float32",
+                "_FillValue": np.float32("nan"),
+                "zlib": True,
+                "complevel": 1,
+                "shuffle": True,
+                "chunksizes": chunksizes,
+            }
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
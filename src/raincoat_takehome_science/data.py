@@ -0,0 +1,248 @@
+"""Gridded storm data sets."""
+
+from __future__ import annotations
+
+import os
+from typing import IO
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from numpy.typing import ArrayLike, NDArray
+
+from .path import calculate_wind_at_given_distance
+
+B_DECK_COLUMNS = (
+    "BASIN",
+    "CY",
+    "YYYYMMDDHH",
+    "TECHNUM",
+    "TECH",
+    "TAU",
+    "Lat",
+    "Lon",
+    "VMAX",
+    "MSLP",
+    "TY",
+    "RAD",
+    "WINDCODE",
+    "RAD1",
+    "RAD2",
+    "RAD3",
+    "RAD4",
+    "POUTER",
+    "ROUTER",
+    "RMW",
+    "GUSTS",
+    "EYE",
+    "SUBREGION",
+    "MAXSEAS",
+    "INITIALS",
+    "DIR",
+    "SPEED",
+    "STORMNAME",
+    "DEPTH",
+    "SEAS",
+    "SEASCODE",
+    "SEAS1",
+    "SEAS2",
+    "SEAS3",
+    "SEAS4",
+)
+"""Column names of an ATCF b-deck record."""
+
+B_DECK_DTYPES = {
+    **dict.fromkeys(("BASIN", "YYYYMMDDHH", "TECH", "Lat", "Lon", "TY", "WINDCODE", "STORMNAME"), str),
+    **dict.fromkeys(
+        (
+            "VMAX",
+            "MSLP",
+            "RAD",
+            "RAD1",
+            "RAD2",
+            "RAD3",
+            "RAD4",
+            "POUTER",
+            "ROUTER",
+            "RMW",
+            "GUSTS",
+            "EYE",
+            "MAXSEAS",
+            "DIR",
+            "SPEED",
+            "SEAS",
+            "SEAS1",
+            "SEAS2",
+            "SEAS3",
+            "SEAS4",
+        ),
+        "float32",
+    ),
+}
+"""Types of the b-deck columns that are known up front."""
+
+NAUTICAL_MILE = 1852.0
+"""Length of a nautical mile in metres."""
+
+KNOT = NAUTICAL_MILE / 3600.0
+"""One knot in metres per second."""
+
+TIME_FORMAT = "%Y%m%dT%H%M"
+"""Format of time stamps in data set attributes."""
+
+
+def convert_lat_lon(coord: pd.Series) -> pd.Series:
+    """Convert ATCF coordinates to signed degrees.
+
+    ATCF stores positions in tenths of a degree followed by the hemisphere,
+    e.g. ``180N`` or ``657W``. Southern and western positions are negative.
+    """
+    coord = coord.str.strip()
+    sign = np.where(coord.str[-1].isin(["S", "W"]), -1.0, 1.0)
+    return coord.str[:-1].astype(float) * 0.1 * sign
+
+
+def read_b_deck(source: str | os.PathLike[str] | IO[str]) -> pd.DataFrame:
+    """Read the records of an ATCF best track (b-deck) file.
+
+    Parameters
+    ----------
+    source:
+        Path to the b-deck file or an open text buffer. Gzip compressed
+        files, as distributed in the NHC archive (``*.dat.gz``), are
+        decompressed while they are parsed. Text that is already in memory
+        has to be wrapped, e.g. in :class:`io.StringIO`.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per record, sorted by time. Positions are converted to
+        degrees, wind speeds to m/s and radii to metres.
+    """
+    df = pd.read_csv(
+        source,
+        header=None,
+        names=B_DECK_COLUMNS,
+        usecols=range(len(B_DECK_COLUMNS)),
+        dtype=B_DECK_DTYPES,
+        skipinitialspace=True,
+        engine="c",
+    )
+    # Records of the same time step share the time stamp, cache the parsing.
+    df["YYYYMMDDHH"] = pd.to_datetime(df["YYYYMMDDHH"].str.strip(), format="%Y%m%d%H", exact=True, cache=True)
+    df["Lat"] = convert_lat_lon(df["Lat"])
+    df["Lon"] = convert_lat_lon(df["Lon"])
+    df["VMAX"] *= KNOT
+    df[["RAD1", "RAD2", "RAD3", "RAD4", "RMW", "ROUTER"]] *= NAUTICAL_MILE
+    return df.sort_values("YYYYMMDDHH", kind="stable", ignore_index=True)
+
+
+class Dataset:
+    """Regular latitude/longitude grid on which storm fields are evaluated.
+
+    Parameters
+    ----------
+    lat:
+        Latitudes of the grid in degrees north.
+    lon:
+        Longitudes of the grid in degrees east.
+    """
+
+    def __init__(self, lat: ArrayLike, lon: ArrayLike) -> None:
+        self.lat = xr.DataArray(
+            np.asarray(lat), dims=("lat",), name="lat", attrs={"units": "degrees_north", "standard_name": "latitude"}
+        )
+        self.lon = xr.DataArray(
+            np.asarray(lon), dims=("lon",), name="lon", attrs={"units": "degrees_east", "standard_name": "longitude"}
+        )
+
+    @classmethod
+    def from_roi(cls, roi: tuple[float, float, float, float], resolution: tuple[float, float]) -> Dataset:
+        """Create a grid covering a region of interest.
+
+        Parameters
+        ----------
+        roi:
+            ``(min_latitude, max_latitude, min_longitude, max_longitude)``
+            of the region of interest, in degrees.
+        resolution:
+            Latitudinal and longitudinal grid spacing in degrees.
+        """
+        min_lat, max_lat, min_lon, max_lon = roi
+        d_lat, d_lon = resolution
+        lat = np.arange(min_lat, max_lat + d_lat / 2, d_lat).astype(np.float32)
+        lon = np.arange(min_lon, max_lon + d_lon / 2, d_lon).astype(np.float32)
+        return cls(lat, lon)
+
+    def calculate_wind_profile(self, b_deck: pd.DataFrame, time_chunks: int | None = None) -> xr.Dataset:
+        """Calculate the wind speed on the grid for every time step of a track.
+
+        Parameters
+        ----------
+        b_deck:
+            Best track records with the columns ``YYYYMMDDHH``, ``VMAX``
+            (m/s), ``RMW`` (m), ``Lat`` and ``Lon`` (degrees). If a time step
+            has multiple records the last one is used.
+        time_chunks:
+            Number of time steps per dask chunk. By default the wind speed is
+            computed eagerly, setting this returns a lazy, dask backed result
+            instead.
+
+        Returns
+        -------
+        xr.Dataset
+            Data set holding the wind speed ``wsp`` of shape (time, lat, lon).
+            The first and last time step are stored in the ``time_min`` and
+            ``time_max`` attributes.
+
+        Raises
+        ------
+        ValueError
+            If the b-deck has no records.
+        """
+        if b_deck.empty:
+            raise ValueError("b-deck has no records to calculate a wind profile from")
+        if not b_deck["YYYYMMDDHH"].is_monotonic_increasing:
+            b_deck = b_deck.sort_values("YYYYMMDDHH", kind="stable", ignore_index=True)
+        # Records of a time step are contiguous, the last one of each block
+        # is where the time changes.
+        times = b_deck["YYYYMMDDHH"].to_numpy()
+        last = np.flatnonzero(np.append(times[1:] != times[:-1], True))
+        time_index = pd.DatetimeIndex(times[last])
+        track = xr.Dataset(
+            {key: ("time", b_deck[key].to_numpy()[last]) for key in ("VMAX", "RMW", "Lat", "Lon")},
+            coords={"time": time_index},
+        )
+        if time_chunks is not None:
+            track = track.chunk({"time": time_chunks})
+        wind_speed = xr.apply_ufunc(
+            _wind_field,
+            track["VMAX"],
+            track["RMW"],
+            track["Lat"],
+            track["Lon"],
+            self.lat,
+            self.lon,
+            input_core_dims=[[], [], [], [], ["lat"], ["lon"]],
+            output_core_dims=[["lat", "lon"]],
+            dask="parallelized",
+            output_dtypes=[np.float32],
+        )
+        wind_speed.attrs = {"long_name": "wind speed", "units": "m s-1"}
+        return xr.Dataset(
+            {"wsp": wind_speed},
+            coords={"lat": self.lat, "lon": self.lon},
+            attrs={"time_min": time_index[0].strftime(TIME_FORMAT), "time_max": time_index[-1].strftime(TIME_FORMAT)},
+        )
+
+
+def _wind_field(
+    vmax: NDArray[np.float64],
+    rmw: NDArray[np.float64],
+    clat: NDArray[np.float64],
+    clon: NDArray[np.float64],
+    lat: NDArray[np.float32],
+    lon: NDArray[np.float32],
+) -> NDArray[np.float32]:
+    """Wind speed of a block of track time steps, as called by ``apply_ufunc``."""
+    return calculate_wind_at_given_distance(vmax, rmw, [lat.reshape(-1, 1), lon.reshape(1, -1)], [clat, clon])
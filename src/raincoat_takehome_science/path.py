@@ -0,0 +1,152 @@
+"""Geometry and wind profile helpers along a tropical cyclone track."""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from typing import Sequence
+
+import numpy as np
+from numba import njit, prange
+from numpy.typing import ArrayLike, NDArray
+
+EARTH_RADIUS = 6_371_000.0
+"""Mean earth radius in metres."""
+
+# The kernel is parallel already, launching it from several threads at once
+# (e.g. dask workers) only oversubscribes the cores and is not supported by
+# all of Numba's threading layers.
+_KERNEL_LOCK = threading.Lock()
+
+
+def haversine_distance(lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike) -> NDArray[np.float64]:
+    """Great circle distance between two sets of points.
+
+    All arguments are in degrees and follow the usual NumPy broadcasting
+    rules, so a grid and a (batch of) storm centre(s) can be passed without
+    tiling either of them.
+
+    Parameters
+    ----------
+    lat1, lon1:
+        Latitude and longitude of the first point(s).
+    lat2, lon2:
+        Latitude and longitude of the second point(s).
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Distance in metres.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    d_lat = lat2 - lat1
+    d_lon = lon2 - lon1
+    a = np.sin(d_lat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(d_lon / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return EARTH_RADIUS * c
+
+
+@njit(inline="always")
+def _haversine(lat1: float, lon1: float, cos_lat1: float, lat2: float, lon2: float, cos_lat2: float) -> float:
+    """Scalar version of :func:`haversine_distance` for coordinates in radians.
+
+    The cosines of the latitudes are passed in, they only change per grid row
+    and storm centre respectively.
+    """
+    a = math.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+# Every fast-math flag except ``nnan``/``ninf``: missing b-deck values are
+# NaN and have to propagate into the wind field.
+@njit(parallel=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True, boundscheck=False)
+def _wind_kernel(
+    lat: NDArray[np.float64],
+    cos_lat: NDArray[np.float64],
+    lon: NDArray[np.float64],
+    clat: float,
+    clon: float,
+    vmax: float,
+    rmw: float,
+    out: NDArray[np.float32],
+) -> None:
+    """Write the wind field around a single storm centre into ``out``.
+
+    ``lat``, ``cos_lat`` and ``lon`` are the 1-D grid coordinates in radians
+    and the cosine of the latitudes.
+    """
+    clat = math.radians(clat)
+    clon = math.radians(clon)
+    cos_clat = math.cos(clat)
+    for i in prange(lat.size):
+        for j in range(lon.size):
+            radius = _haversine(lat[i], lon[j], cos_lat[i], clat, clon, cos_clat)
+            out[i, j] = vmax * (radius / rmw) ** 1.5 if radius <= rmw else vmax * (rmw / radius) ** 0.5
+
+
+def calculate_wind_at_given_distance(
+    vmax: ArrayLike,
+    rmw: ArrayLike,
+    geo_loc: Sequence[ArrayLike],
+    storm_centre: Sequence[ArrayLike],
+) -> NDArray[np.float32]:
+    """Wind speed of a Jelesnianski type profile on a set of locations.
+
+    The wind speed grows with ``(r / rmw) ** 1.5`` inside the radius of
+    maximum winds and decays with ``(rmw / r) ** 0.5`` outside of it.
+
+    Parameters
+    ----------
+    vmax:
+        Maximum sustained wind speed.
+    rmw:
+        Radius of maximum winds in metres.
+    geo_loc:
+        Latitude and longitude of a rectilinear grid, in degrees, given as
+        broadcast views of shape ``(Nlat, 1)`` and ``(1, Nlon)``, e.g.
+        ``[lat[:, None], lon[None, :]]``.
+    storm_centre:
+        Latitude and longitude of the storm centre, in degrees.
+
+    Returns
+    -------
+    NDArray[np.float32]
+        Wind speed in the unit of ``vmax``. The calculation is done in double
+        precision, only the result is stored in single precision.
+
+    Raises
+    ------
+    ValueError
+        If the coordinates are not shaped ``(Nlat, 1)`` and ``(1, Nlon)``.
+
+    Notes
+    -----
+    The storm parameters can be given as arrays of shape ``(T,)`` to
+    calculate the wind field for all ``T`` time steps of a track in one call.
+    The result then has the shape ``(T, Nlat, Nlon)``.
+    """
+    lat, lon = (np.asarray(coord, dtype=np.float64) for coord in geo_loc)
+    if lat.ndim != 2 or lat.shape[1] != 1 or lon.ndim != 2 or lon.shape[0] != 1:
+        raise ValueError(
+            f"geo_loc has to be latitudes of shape (Nlat, 1) and longitudes of shape (1, Nlon), "
+            f"got {lat.shape} and {lon.shape}"
+        )
+    # The grid is the same for all storm centres, convert it only once.
+    lat = np.radians(lat[:, 0])
+    lon = np.radians(lon[0, :])
+    cos_lat = np.cos(lat)
+    grid_shape = (lat.size, lon.size)
+    params = np.broadcast_arrays(*(np.asarray(p, dtype=np.float64) for p in (*storm_centre, vmax, rmw)))
+    result = np.empty(params[0].shape + grid_shape, dtype=np.float32)
+    fields = result.reshape((-1,) + grid_shape)
+    with _KERNEL_LOCK:
+        for n, (clat, clon, v_max, r_max) in enumerate(zip(*(p.flat for p in params))):
+            _wind_kernel(lat, cos_lat, lon, clat, clon, v_max, r_max, fields[n])
+    return result
+
+
+if os.environ.get("RAINCOAT_NUMBA_WARMUP", "").strip().lower() not in ("", "0", "false"):
+    # Compile the kernel, or load it from the on-disk cache, at import time
+    # instead of on the first call.
+    calculate_wind_at_given_distance(1.0, 1.0, [np.zeros((2, 1)), np.zeros((1, 2))], [0.0, 0.0])
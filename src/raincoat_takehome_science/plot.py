@@ -0,0 +1,81 @@
+"""Interactive visualisation of gridded storm data."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import xarray as xr
+from IPython.display import display
+
+
+class InteractiveMapPlotWidget:
+    """Map of a (time, lat, lon) field with a slider to step through time.
+
+    The figure is redrawn in place, an interactive matplotlib backend such as
+    ``%matplotlib widget`` is therefore needed inside a notebook.
+
+    Parameters
+    ----------
+    dataarray:
+        Data to plot, with the dimensions ``time``, ``lat`` and ``lon``.
+    cmap:
+        Name of the colour map.
+    **kwargs:
+        Additional keyword arguments passed to :func:`matplotlib.pyplot.subplots`.
+    """
+
+    def __init__(self, dataarray: xr.DataArray, cmap: str = "viridis", **kwargs: Any) -> None:
+        self.dataarray = dataarray.transpose("time", "lat", "lon")
+        # The colour limits are fixed for all time steps, compute them once
+        # instead of reducing the whole array on every slider change.
+        self._vmin = float(self.dataarray.quantile(0.01).values)
+        self._vmax = float(self.dataarray.quantile(0.99).values)
+        self.fig, self.ax = plt.subplots(**kwargs)
+        self.im = self.ax.pcolormesh(
+            self.dataarray.lon,
+            self.dataarray.lat,
+            self.dataarray.isel(time=0).values,
+            vmin=self._vmin,
+            vmax=self._vmax,
+            cmap=cmap,
+            shading="nearest",
+        )
+        self.fig.colorbar(self.im, ax=self.ax, label=self._label)
+        self.ax.set_xlabel("Longitude [°E]")
+        self.ax.set_ylabel("Latitude [°N]")
+        self.slider = widgets.IntSlider(value=0, min=0, max=self.dataarray.sizes["time"] - 1, description="Time step")
+        self.slider.observe(self._update_plot, names="value")
+        self._set_title(0)
+
+    @property
+    def _label(self) -> str:
+        name = self.dataarray.attrs.get("long_name", self.dataarray.name or "")
+        units = self.dataarray.attrs.get("units")
+        return f"{name} [{units}]" if units else str(name)
+
+    def _set_title(self, time_step: int) -> None:
+        time = self.dataarray.time.isel(time=time_step).dt.strftime("%Y-%m-%d %H:%M").item()
+        self.ax.set_title(time)
+
+    def _update_plot(self, change: dict[str, Any]) -> None:
+        self.plot_map(change["new"])
+
+    def plot_map(self, time_step: int) -> None:
+        """Show the data of a given time step.
+
+        Parameters
+        ----------
+        time_step:
+            Index along the time dimension.
+        """
+        data_at_time = self.dataarray.isel(time=time_step)
+        self.im.set_array(data_at_time.values.ravel())
+        self._set_title(time_step)
+        self.fig.canvas.draw_idle()
+
+    def show(self) -> None:
+        """Display the slider and the figure."""
+        display(self.slider)
+        plt.show()
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import netCDF4
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from raincoat_takehome_science.cli import main
+
+B_DECK = Path(__file__).parent / "data" / "bal152017.dat"
+
+
+def test_main_writes_wind_field_chunked_per_time_step(tmp_path):
+    out_file = tmp_path / "out" / "wind.nc"
+    result = CliRunner().invoke(main, [str(B_DECK), str(out_file)])
+    assert result.exit_code == 0, result.output
+    with netCDF4.Dataset(out_file) as nc:
+        wsp = nc["wsp"]
+        assert wsp.dimensions == ("time", "lat", "lon")
+        assert wsp.dtype == np.float32
+        assert wsp.chunking() == [1, 11, 21]
+        assert nc.time_min == "20170916T1800"
+        assert nc.time_max == "20170920T1200"
+
+
+def test_main_writes_with_h5netcdf_engine(tmp_path):
+    pytest.importorskip("h5netcdf")
+    pytest.importorskip("h5py")
+    out_file = tmp_path / "wind.nc"
+    result = CliRunner().invoke(main, [str(B_DECK), str(out_file), "--engine", "h5netcdf"])
+    assert result.exit_code == 0, result.output
+    with netCDF4.Dataset(out_file) as nc:
+        assert nc["wsp"].chunking() == [1, 11, 21]
@@ -0,0 +1,104 @@
+import gzip
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from raincoat_takehome_science.data import Dataset, convert_lat_lon, read_b_deck
+from raincoat_takehome_science.path import calculate_wind_at_given_distance
+
+B_DECK = Path(__file__).parent / "data" / "bal152017.dat"
+
+
+@pytest.fixture
+def b_deck() -> pd.DataFrame:
+    return read_b_deck(B_DECK)
+
+
+def test_convert_lat_lon():
+    converted = convert_lat_lon(pd.Series(["180N", " 657W", "123S", "1755E"]))
+    np.testing.assert_allclose(converted, [18.0, -65.7, -12.3, 175.5])
+
+
+def test_read_b_deck_sorts_records_by_time(b_deck):
+    assert len(b_deck) == 4
+    assert b_deck["YYYYMMDDHH"].is_monotonic_increasing
+    assert b_deck["YYYYMMDDHH"].iloc[0] == pd.Timestamp("2017-09-16T18:00")
+    # The two records of 2017092006 keep their order in the file.
+    assert b_deck["RAD"].iloc[1:3].tolist() == [34, 50]
+
+
+def test_read_b_deck_converts_positions_and_units(b_deck):
+    record = b_deck.iloc[1]
+    assert record["Lat"] == pytest.approx(18.0)
+    assert record["Lon"] == pytest.approx(-65.7)
+    # 135 kt and radii in nautical miles.
+    assert record["VMAX"] == pytest.approx(69.45, rel=1e-6)
+    assert record["RMW"] == pytest.approx(27_780.0)
+    assert record["RAD1"] == pytest.approx(240_760.0)
+    assert record["ROUTER"] == pytest.approx(370_400.0)
+
+
+def test_read_b_deck_handles_ragged_rows_and_blank_fields(b_deck):
+    depression, short_record = b_deck.iloc[0], b_deck.iloc[2]
+    assert np.isnan(depression["RMW"])
+    assert pd.isna(depression["STORMNAME"])
+    assert short_record["RMW"] == pytest.approx(37_040.0)
+    assert pd.isna(short_record["GUSTS"])
+    assert b_deck["STORMNAME"].iloc[1] == "MARIA"
+
+
+def test_read_b_deck_from_gzip_path_text_buffer_and_str_path(tmp_path):
+    compressed = tmp_path / "bal152017.dat.gz"
+    compressed.write_bytes(gzip.compress(B_DECK.read_bytes()))
+    expected = read_b_deck(StringIO(B_DECK.read_text()))
+    pd.testing.assert_frame_equal(read_b_deck(compressed), expected)
+    pd.testing.assert_frame_equal(read_b_deck(str(compressed)), expected)
+    with B_DECK.open() as stream:
+        pd.testing.assert_frame_equal(read_b_deck(stream), expected)
+
+
+GRID = Dataset.from_roi((17.5, 18.5, -67.5, -65.5), (0.1, 0.1))
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_calculate_wind_profile_uses_last_record_per_time_step(b_deck, reverse):
+    if reverse:
+        b_deck = b_deck.iloc[::-1]
+    dset = GRID.calculate_wind_profile(b_deck)
+    assert dset["wsp"].dims == ("time", "lat", "lon")
+    assert dset["wsp"].shape == (3, 11, 21)
+    assert dset.attrs["time_min"] == "20170916T1800"
+    assert dset.attrs["time_max"] == "20170920T1200"
+    # No wind speed exceeds the maximum sustained wind of the track.
+    assert float(dset["wsp"].max()) <= 69.45 + 1e-3
+    # The two records of 2017092006 differ, the one given last has to be used.
+    record = b_deck[b_deck["YYYYMMDDHH"] == "2017-09-20T06"].iloc[-1]
+    expected = calculate_wind_at_given_distance(
+        record["VMAX"],
+        record["RMW"],
+        [GRID.lat.values[:, None], GRID.lon.values[None, :]],
+        [record["Lat"], record["Lon"]],
+    )
+    np.testing.assert_array_equal(dset["wsp"].sel(time="2017-09-20T06").values, expected)
+
+
+def test_calculate_wind_profile_rejects_empty_b_deck(b_deck):
+    with pytest.raises(ValueError, match="no records"):
+        GRID.calculate_wind_profile(b_deck.iloc[:0])
+
+
+def test_calculate_wind_profile_lazily_with_dask(b_deck):
+    dask = pytest.importorskip("dask")
+    eager = GRID.calculate_wind_profile(b_deck)
+    lazy = GRID.calculate_wind_profile(b_deck, time_chunks=1)
+    assert lazy["wsp"].chunks == ((1, 1, 1), (11,), (21,))
+    assert lazy.attrs == eager.attrs
+    # The threaded scheduler runs the chunks concurrently, the kernel calls
+    # have to be serialised.
+    with dask.config.set(scheduler="threads"):
+        computed = lazy.compute()
+    xr.testing.assert_identical(computed, eager)
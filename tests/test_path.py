@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from raincoat_takehome_science.path import (
+    calculate_wind_at_given_distance,
+    haversine_distance,
+)
+
+LAT = np.arange(17.5, 18.55, 0.1)
+LON = np.arange(-67.5, -65.45, 0.1)
+
+
+def reference_wind(vmax, rmw, lat, lon, clat, clon):
+    """Wind profile evaluated with plain NumPy on top of haversine_distance."""
+    radius = haversine_distance(lat, lon, clat, clon)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(radius <= rmw, vmax * (radius / rmw) ** 1.5, vmax * (rmw / radius) ** 0.5)
+
+
+def test_haversine_distance():
+    assert haversine_distance(0.0, 0.0, 1.0, 0.0) == pytest.approx(111_194.9, abs=0.1)
+    assert haversine_distance(18.0, -66.0, 18.0, -66.0) == 0.0
+
+
+def test_wind_matches_reference_inside_and_outside_rmw():
+    vmax, rmw, clat, clon = 50.0, 30_000.0, 18.0, -66.3
+    wind = calculate_wind_at_given_distance(vmax, rmw, [LAT[:, None], LON[None, :]], [clat, clon])
+    radius = haversine_distance(LAT[:, None], LON[None, :], clat, clon)
+    assert (radius <= rmw).any() and (radius > rmw).any()
+    assert wind.shape == (LAT.size, LON.size)
+    assert wind.dtype == np.float32
+    np.testing.assert_allclose(wind, reference_wind(vmax, rmw, LAT[:, None], LON[None, :], clat, clon), rtol=1e-5)
+
+
+@pytest.mark.parametrize("vmax, rmw", [(np.nan, 30_000.0), (50.0, np.nan)])
+def test_wind_propagates_nan(vmax, rmw):
+    wind = calculate_wind_at_given_distance(vmax, rmw, [LAT[:, None], LON[None, :]], [18.0, -66.3])
+    assert np.isnan(wind).all()
+
+
+def test_wind_for_batch_of_centres():
+    vmax = np.array([30.0, 50.0, 60.0])
+    rmw = np.array([20_000.0, 30_000.0, 45_000.0])
+    clat = np.array([17.6, 18.0, 18.4])
+    clon = np.array([-67.0, -66.3, -65.8])
+    wind = calculate_wind_at_given_distance(vmax, rmw, [LAT[:, None], LON[None, :]], [clat, clon])
+    assert wind.shape == (3, LAT.size, LON.size)
+    expected = reference_wind(
+        vmax[:, None, None],
+        rmw[:, None, None],
+        LAT[None, :, None],
+        LON[None, None, :],
+        clat[:, None, None],
+        clon[:, None, None],
+    )
+    np.testing.assert_allclose(wind, expected, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "geo_loc",
+    [
+        np.meshgrid(LAT, LON),
+        np.meshgrid(LAT, LON, indexing="ij"),
+        [LAT[:3], LON[:3]],
+        [LAT[None, :], LON[:, None]],
+    ],
+)
+def test_wind_rejects_tiled_or_flat_coordinates(geo_loc):
+    with pytest.raises(ValueError, match="geo_loc"):
+        calculate_wind_at_given_distance(50.0, 30_000.0, geo_loc, [18.0, -66.3])
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from raincoat_takehome_science.data import Dataset, read_b_deck
+from raincoat_takehome_science.plot import InteractiveMapPlotWidget
+
+B_DECK = Path(__file__).parent / "data" / "bal152017.dat"
+
+
+@pytest.fixture
+def widget():
+    plt.switch_backend("Agg")
+    wsp = Dataset.from_roi((17.5, 18.5, -67.5, -65.5), (0.1, 0.1)).calculate_wind_profile(read_b_deck(B_DECK))["wsp"]
+    widget = InteractiveMapPlotWidget(wsp)
+    yield widget
+    plt.close(widget.fig)
+
+
+def test_slider_updates_mesh_in_place(widget):
+    im = widget.im
+    widget.slider.value = 2
+    assert widget.im is im
+    assert len(widget.ax.collections) == 1
+    assert im.get_clim() == (widget._vmin, widget._vmax)
+    np.testing.assert_array_equal(im.get_array(), widget.dataarray.isel(time=2).values.ravel())
+    assert widget.ax.get_title() == "2017-09-20 12:00"
+
+
+def test_colour_limits_are_computed_once(widget, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("colour limits recomputed")
+
+    monkeypatch.setattr(type(widget.dataarray), "quantile", fail)
+    widget.plot_map(1)
+    assert widget.im.get_clim() == (widget._vmin, widget._vmax)
+    assert widget.ax.get_title() == "2017-09-20 06:00"